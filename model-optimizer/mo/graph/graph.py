@@ -22,8 +22,8 @@ import networkx as nx
 import numpy as np
 
 from mo.graph.port import Port
-from mo.middle.passes.eliminate import mark_output_reachable_nodes, shape_inference, mark_undead_nodes, \
-    mark_const_producer_nodes, eliminate_dead_nodes, add_constant_operations
+from mo.middle.passes.eliminate import shape_inference, mark_undead_nodes, mark_dead_nodes, eliminate_dead_nodes, \
+    add_constant_operations
 from mo.utils.error import Error
 from mo.utils.utils import refer_to_faq_msg, deprecated_api, shrink_str_value
 
@@ -33,6 +33,10 @@ def dict_to_ordered_dict(d: dict, func=lambda t: t):
 
 
 class Node:
+    # Node is a lightweight accessor to the node attributes stored in the graph, so it keeps only references to the graph
+    # and the node id without per-instance dictionary
+    __slots__ = ('graph', 'node', 'id')
+
     def __init__(self, graph, node: str):
         assert node in graph, "Attempt to access node {} that not in graph".format(node)
 
@@ -87,7 +91,9 @@ class Node:
         if not self.has_valid('_in_ports'):
             Node(self.graph, self.id)['_in_ports'] = {}
         control_flow = kwargs['control_flow'] if kwargs.get('control_flow') is not None else False
-        if skip_if_exist is False and idx in self.in_ports(control_flow=control_flow):
+        # check the _in_ports dictionary directly instead of building all Port objects with in_ports()
+        port_attrs = self._in_ports.get(idx)
+        if skip_if_exist is False and port_attrs is not None and (control_flow or not port_attrs.get('control_flow')):
             raise Error("Input port with {} index already exists for {} node.".format(idx, self.name))
         self._in_ports.update({idx: kwargs})
 
@@ -116,7 +122,9 @@ class Node:
         if not self.has_valid('_out_ports'):
             Node(self.graph, self.id)['_out_ports'] = {}
         control_flow = kwargs['control_flow'] if kwargs.get('control_flow') is not None else False
-        if skip_if_exist is False and idx in self.out_ports(control_flow=control_flow):
+        # check the _out_ports dictionary directly instead of building all Port objects with out_ports()
+        port_attrs = self._out_ports.get(idx)
+        if skip_if_exist is False and port_attrs is not None and (control_flow or not port_attrs.get('control_flow')):
             raise Error("Output port with {} index already exists for {} node.".format(idx, self.name))
         self._out_ports.update({idx: kwargs})
 
@@ -552,6 +560,10 @@ class Graph(nx.MultiDiGraph):
     def __init__(self, data=None, **attr):
         self.stage = None
         self.strict_mode = True
+        # the counter is incremented on every structural modification of the graph and is used to validate results
+        # of the output reachability walk cached by the dead nodes elimination passes
+        self._mutation_id = 0
+        self._reach_cache = None
         super().__init__(data, **attr)
 
         if not hasattr(self, 'node'):
@@ -563,12 +575,21 @@ class Graph(nx.MultiDiGraph):
     # all provided methods below are designed to be more safe and convenient
     # be careful while using other methods from nx.MultiDiGraph
 
+    def _invalidate_caches(self):
+        self._mutation_id += 1
+        self._reach_cache = None
+
     def add_node(self, node_for_adding, **attrs):
         # TODO: check required attrs for node
         super().add_node(node_for_adding, **attrs)
+        self._invalidate_caches()
         node = Node(self, node_for_adding)
         node.update_node()
 
+    def add_nodes_from(self, nodes_for_adding, **attr):
+        super().add_nodes_from(nodes_for_adding, **attr)
+        self._invalidate_caches()
+
     def add_edge(self, u_for_edge, v_for_edge, key=None, **attr):
 
         # TODO: turn on strict mode
@@ -596,6 +617,7 @@ class Graph(nx.MultiDiGraph):
                     assert 'out' in attr, "Attribute out is missing when adding edge from {}".format(u_for_edge)
                     assert unode.has_port('out', attr['out']), "{} Node {} has no out port ({})".format(message, unode.name, attr['out'])
 
+        self._invalidate_caches()
         return super().add_edge(u_for_edge, v_for_edge, key=key, **attr)
 
     def add_edges_from(self, ebunch_to_add, **attr):
@@ -617,8 +639,21 @@ class Graph(nx.MultiDiGraph):
             self.add_edge(u, v, key=key, **ddd)
 
     def remove_edge(self, u, v, key=None):
+        self._invalidate_caches()
         return super().remove_edge(u, v, key=key)
 
+    def remove_edges_from(self, ebunch):
+        self._invalidate_caches()
+        return super().remove_edges_from(ebunch)
+
+    def remove_node(self, n):
+        self._invalidate_caches()
+        return super().remove_node(n)
+
+    def remove_nodes_from(self, nodes):
+        self._invalidate_caches()
+        return super().remove_nodes_from(nodes)
+
     def erase_node(self, node: Node):
         """
         Erases node from the graph and reconnect edges from input node(s) to output node(s)
@@ -631,9 +666,10 @@ class Graph(nx.MultiDiGraph):
         inputs = list(self.in_edges(node_id, data=True))
         outputs = list(self.out_edges(node_id, data=True))
 
-        assert node.kind == 'op' and (len(node.out_nodes()) == 0 or list(node.out_nodes().values())[0].kind != 'data'), \
+        out_nodes = node.out_nodes()
+        assert node.kind == 'op' and (len(out_nodes) == 0 or list(out_nodes.values())[0].kind != 'data'), \
             "The function must be used before the partial infer when graph doesn't contain data nodes."
-        assert len(node.out_nodes()) <= 1, "The node {} must produce just one output tensor".format(
+        assert len(out_nodes) <= 1, "The node {} must produce just one output tensor".format(
             node.soft_get('name'))
         assert len(inputs) <= 1, "The node {} must have just one input".format(node.soft_get('name'))
 
@@ -649,10 +685,10 @@ class Graph(nx.MultiDiGraph):
 
         input_node_id = inputs[0][0]
         for src, dst, attrs in outputs:
-            self.remove_edge(src, dst)
             # update the 'out' attribute of the edge from the node being removed
             attrs['out'] = inputs[0][2]['out']
             self.add_edge(input_node_id, dst, **attrs)
+        # all edges of the node are removed together with the node at once
         self.remove_node(node_id)
 
     def get_edge_data(self, u, v, key=None, default=None):
@@ -708,6 +744,10 @@ class Graph(nx.MultiDiGraph):
         return [node for node in data_nodes if has_value is None or node.has_valid('value') == has_value]
 
     def get_nodes_with_attributes(self, **attrs: dict):
+        """
+        Returns names of nodes having all specified attributes values. The names are returned in the order the nodes
+        were added to the graph, so the result is deterministic and does not need to be sorted.
+        """
         node_attrs = self.nodes(data=True)
         return [n for n, d in node_attrs if all(a in d.items() for a in attrs.items())]
 
@@ -981,10 +1021,9 @@ class Graph(nx.MultiDiGraph):
         if 'cmd_params' in self.graph and getattr(self.graph['cmd_params'], 'keep_shape_ops'):
             undead_node_types.extend(['ShapeOf', 'Shape'])
 
-        mark_output_reachable_nodes(self)
         shape_inference(self)
         mark_undead_nodes(self, undead_node_types)
-        mark_const_producer_nodes(self)
+        mark_dead_nodes(self)
         eliminate_dead_nodes(self)
         # Add Const op for constant data nodes
         add_constant_operations(self)
@@ -77,6 +77,22 @@ class TestGetNodeById(unittest.TestCase):
         self.assertRaises(Error, self.graph.get_node_id_by_name, '1')
 
 
+class TestGetNodesWithAttributes(unittest.TestCase):
+    def setUp(self):
+        self.graph = build_graph(nodes, edges)
+        for node_name, node_attrs in self.graph.nodes(data=True):
+            node_attrs['is_marked'] = node_name in ['2', '3', '6']
+
+    def test_get_nodes_with_attributes_order(self):
+        self.assertListEqual(self.graph.get_nodes_with_attributes(is_marked=True), ['2', '3', '6'])
+        self.assertListEqual(self.graph.get_nodes_with_attributes(is_marked=True, op='NotPlaceholder'), ['2', '3'])
+
+    def test_get_nodes_with_attributes_after_direct_write(self):
+        self.graph.node['4']['is_marked'] = True
+        Node(self.graph, '2').is_marked = False
+        self.assertListEqual(self.graph.get_nodes_with_attributes(is_marked=True), ['3', '4', '6'])
+
+
 class TestEraseNode(unittest.TestCase):
     def test_remove_noop_nodes_middle(self):
         graph = build_graph(
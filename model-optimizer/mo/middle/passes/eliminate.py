@@ -16,6 +16,7 @@
 import logging as log
 import re
 from collections import deque
+from itertools import chain
 
 import networkx as nx
 import numpy as np
@@ -46,29 +47,112 @@ def reverse_dfs(graph, node_name: str, update_func: callable, visited: set = Non
                 d.append(in_node_name)
 
 
-def mark_input_nodes(graph, node_name: str, key: str, value):
-    for input, _ in graph.in_edges(node_name):
-        graph.node[input][key] = value
-
-
 def mark_output_nodes(graph, node_name: str, key: str, value):
     for output, _ in graph.out_edges(node_name):
         graph.node[output][key] = value
 
 
+def _removable_const_ops(graph):
+    """
+    Returns the set of Const operations which are removed by the graph clean up even if they are output reachable: they
+    produce constant values only, are not undead and have no incoming edges. Such nodes are re-created from their
+    output data nodes by add_constant_operations.
+    """
+    nodes_attrs = graph._node
+    removable = set()
+    for node_name, attrs in nodes_attrs.items():
+        if attrs.get('type') != 'Const' or attrs.get('is_undead', False) or attrs.get('is_input', False):
+            continue
+        if graph.in_degree(node_name) != 0:
+            continue
+        if all(not cf and nodes_attrs[dst].get('value') is not None
+               for _, dst, cf in graph.out_edges(node_name, data='control_flow_edge', default=False)):
+            removable.add(node_name)
+    return frozenset(removable)
+
+
+def _output_reachable_nodes(graph):
+    """
+    Returns the set of nodes connected to one of the nodes that has attribute op=Result.
+    """
+    outputs = graph.get_nodes_with_attributes(op='Result')
+    if log.getLogger().isEnabledFor(log.DEBUG):
+        log.debug('The following nodes are seeded as output reachable:\n{}'.format(
+            '\n'.join(sorted(map(str, outputs)))))
+
+    # the result of the previous walk is valid while the graph structure and the set of outputs are not changed
+    cache_key = (graph._mutation_id, frozenset(outputs))
+    if graph._reach_cache is not None and graph._reach_cache[0] == cache_key:
+        return graph._reach_cache[1]
+
+    # Const operations removed by the graph clean up anyway are not visited. They have no incoming edges so nothing is
+    # hidden behind them and they are reported as output reachable if one of their consumers is
+    removable_consts = _removable_const_ops(graph)
+
+    # bind the graph methods to locals to avoid lookups on every iteration
+    predecessors = graph.predecessors
+    live = set(outputs)
+    stack = list(chain.from_iterable(predecessors(output_name) for output_name in outputs))
+    while stack:
+        node_name = stack.pop()
+        if node_name in live or node_name in removable_consts:
+            continue
+        live.add(node_name)
+        stack.extend(predecessors(node_name))
+    live.update(node_name for node_name in removable_consts
+                if any(consumer in live for consumer in graph.successors(node_name)))
+    live = frozenset(live)
+    graph._reach_cache = (cache_key, live)
+    return live
+
+
+def _const_producer_flags(graph):
+    """
+    Returns boolean array with flags whether the node produces constant values. The array is indexed by the node
+    position in the graph nodes order.
+    """
+    nodes_attrs = graph._node
+    no_value = np.fromiter((attrs.get('value') is None for attrs in nodes_attrs.values()), dtype=np.bool_,
+                           count=len(nodes_attrs))
+
+    # the node is not a const producer if one of its consumers has no value or it has control flow edges, so the
+    # flags are not propagated through the graph and are computed for all edges at once
+    node_idx = {node_name: idx for idx, node_name in enumerate(nodes_attrs)}
+    edges = list(graph.edges(data='control_flow_edge', default=False))
+    src = np.fromiter((node_idx[u] for u, _, _ in edges), dtype=np.int64, count=len(edges))
+    dst = np.fromiter((node_idx[v] for _, v, _ in edges), dtype=np.int64, count=len(edges))
+    control_flow = np.fromiter((bool(cf) for _, _, cf in edges), dtype=np.bool_, count=len(edges))
+
+    is_const = np.ones(len(node_idx), dtype=np.bool_)
+    is_const[src[control_flow | no_value[dst]]] = False
+    is_const[dst[control_flow]] = False
+    return is_const
+
+
+def mark_dead_nodes(graph):
+    """
+    Mark nodes whether they are outputs reachable or not (attribute 'is_output_reachable') and whether they produce
+    constant values (attribute 'is_const_producer'). The node is considered output reachable if it is connected to one
+    of the nodes that has attribute op=Result.
+    :param graph: graph to operate on.
+    :return: None
+    """
+    live = _output_reachable_nodes(graph)
+    is_const = _const_producer_flags(graph)
+    for (node_name, node_attrs), const_producer in zip(graph._node.items(), is_const.tolist()):
+        node_attrs['is_output_reachable'] = node_name in live
+        node_attrs['is_const_producer'] = const_producer
+
+
+@deprecated_api('mo.middle.passes.eliminate', 'mark_dead_nodes')
 def mark_output_reachable_nodes(graph):
     """
     Mark nodes whether they are outputs reachable or not. The node is considered output reachable if it is connected to
     one of the nodes that has attribute op=Result.
     """
-    nx.set_node_attributes(G=graph, name='is_output_reachable', values=False)
-    outputs = graph.get_nodes_with_attributes(op='Result')
-    log.debug('The following nodes are seeded as output reachable:\n{}'.format('\n'.join(sorted(map(str, outputs)))))
-    nx.set_node_attributes(G=graph, name='is_output_reachable', values={n: True for n in outputs})
-    visited = set()
-    for output_name in outputs:
-        reverse_dfs(graph, output_name,
-                    lambda graph, node_name: mark_input_nodes(graph, node_name, 'is_output_reachable', True), visited)
+    live = _output_reachable_nodes(graph)
+    for node_name, node_attrs in graph._node.items():
+        node_attrs['is_output_reachable'] = node_name in live
 
 
 def mark_undead_nodes(graph, undead_types: list):
@@ -107,23 +191,16 @@ def mark_undead_nodes(graph, undead_types: list):
     nx.set_node_attributes(G=graph, name='is_undead', values={n: True for n in inputs})
 
 
+@deprecated_api('mo.middle.passes.eliminate', 'mark_dead_nodes')
 def mark_const_producer_nodes(graph):
     """
     Mark nodes that produce constant values.
     :param graph: graph to operate on.
     :return: .
     """
-    nx.set_node_attributes(G=graph, name='is_const_producer', values=True)
-
-    for node in graph.pseudo_topological_sort():
-        for input, output, attrs in graph.in_edges(node.id, data=True):
-            if 'control_flow_edge' in attrs and attrs['control_flow_edge']:
-                graph.node[input]['is_const_producer'] = False
-                graph.node[output]['is_const_producer'] = False
-
-        if not node.has('value') or node.value is None:
-            for input, _ in graph.in_edges(node.id):
-                graph.node[input]['is_const_producer'] = False
+    is_const = _const_producer_flags(graph)
+    for node_attrs, const_producer in zip(graph._node.values(), is_const.tolist()):
+        node_attrs['is_const_producer'] = const_producer
 
 
 def eliminate_dead_nodes(graph):
@@ -133,7 +210,8 @@ def eliminate_dead_nodes(graph):
                 (node_attrs['is_const_producer'] and (not node_attrs['is_undead'] or
                                                       node_attrs.get('force_dead_node', False))):
             nodes_to_remove.add(node_name)
-    log.debug('Removing the following dead nodes: {}'.format('\n'.join(sorted(map(str, nodes_to_remove)))))
+    if log.getLogger().isEnabledFor(log.DEBUG):
+        log.debug('Removing the following dead nodes: {}'.format('\n'.join(sorted(map(str, nodes_to_remove)))))
     graph.remove_nodes_from(nodes_to_remove)
 
 
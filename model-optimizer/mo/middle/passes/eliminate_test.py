@@ -15,11 +15,14 @@
 """
 
 import unittest
+from copy import deepcopy
+from types import MappingProxyType
 
 import numpy as np
 
 from mo.graph.graph import Node
-from mo.middle.passes.eliminate import mark_output_reachable_nodes, mark_const_producer_nodes
+from mo.middle.passes.eliminate import mark_output_reachable_nodes, mark_const_producer_nodes, mark_dead_nodes, \
+    mark_undead_nodes, eliminate_dead_nodes
 from mo.utils.unittest.graph import build_graph
 
 nodes_attributes = {'placeholder_1': {'type': 'Parameter', 'kind': 'op'},
@@ -39,6 +42,8 @@ nodes_attributes = {'placeholder_1': {'type': 'Parameter', 'kind': 'op'},
                     'data_node_4': {'value': None, 'kind': 'data'},
                     'data_node_5': {'value': None, 'shape': None, 'kind': 'data'},
                     'data_node_6': {'value': None, 'shape': None, 'kind': 'data'},
+                    'const_1': {'type': 'Const', 'kind': 'op', 'op': 'Const'},
+                    'const_1_data': {'value': None, 'kind': 'data'},
                     'tf_call_1': {'type': 'TFCustomSubgraphCall', 'kind': 'op'},
                     'tf_call_2': {'type': 'TFCustomSubgraphCall', 'kind': 'op'},
                     'tf_call_3': {'type': 'TFCustomSubgraphCall', 'kind': 'op'},
@@ -46,9 +51,35 @@ nodes_attributes = {'placeholder_1': {'type': 'Parameter', 'kind': 'op'},
                     'op_output_1': {'kind': 'op', 'op': 'Result'},
                     'op_output_2': {'kind': 'op', 'op': 'Result'}
                     }
+nodes_attributes = {k: MappingProxyType(v) for k, v in nodes_attributes.items()}
+
+# the value is shared between tests and nodes so it is made read-only
+const_value = np.array(1)
+const_value.setflags(write=False)
 
 
 class TestEliminatePass(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """
+        Builds graphs shared by several tests. The tests modify graphs so each test works with its own deep copy.
+
+        placeholder_1->node_1->node_2
+              \
+               -> node_3->node_4
+
+        "node_4" is output.
+        """
+        cls.graph_with_unreachable_branch = build_graph(nodes_attributes,
+                                                        [('placeholder_1', 'node_1'),
+                                                         ('node_1', 'node_2'),
+                                                         ('placeholder_1', 'node_3'),
+                                                         ('node_3', 'node_4'),
+                                                         ('node_4', 'op_output')
+                                                         ],
+                                                        {'node_4': {}},
+                                                        nodes_with_edges_only=True)
+
     def test_mark_output_unreachable_nodes(self):
         """
         Checks that all nodes that are unreachable from output nodes are marked correspondingly.
@@ -61,21 +92,13 @@ class TestEliminatePass(unittest.TestCase):
 
         :return: None
         """
-        graph = build_graph(nodes_attributes,
-                            [('placeholder_1', 'node_1'),
-                             ('node_1', 'node_2'),
-                             ('placeholder_1', 'node_3'),
-                             ('node_3', 'node_4'),
-                             ('node_4', 'op_output')
-                             ],
-                            {'node_4': {}},
-                            nodes_with_edges_only=True)
+        graph = deepcopy(self.graph_with_unreachable_branch)
         mark_output_reachable_nodes(graph)
 
-        self.assertListEqual(sorted(['placeholder_1', 'node_3', 'op_output', 'node_4']),
-                             sorted(graph.get_nodes_with_attributes(is_output_reachable=True)))
-        self.assertListEqual(sorted(['node_1', 'node_2']),
-                             sorted(graph.get_nodes_with_attributes(is_output_reachable=False)))
+        self.assertCountEqual(['placeholder_1', 'node_3', 'op_output', 'node_4'],
+                              graph.get_nodes_with_attributes(is_output_reachable=True))
+        self.assertCountEqual(['node_1', 'node_2'],
+                              graph.get_nodes_with_attributes(is_output_reachable=False))
 
     def test_mark_output_unreachable_nodes_behind_output(self):
         """
@@ -97,10 +120,153 @@ class TestEliminatePass(unittest.TestCase):
                             nodes_with_edges_only=True)
         mark_output_reachable_nodes(graph)
 
-        self.assertListEqual(sorted(['node_1', 'node_2', 'op_output', 'placeholder_1']),
-                             sorted(graph.get_nodes_with_attributes(is_output_reachable=True)))
+        self.assertCountEqual(['node_1', 'node_2', 'op_output', 'placeholder_1'],
+                              graph.get_nodes_with_attributes(is_output_reachable=True))
         self.assertFalse(graph.node['node_3']['is_output_reachable'])
 
+    def test_mark_output_reachable_nodes_skips_const_ops(self):
+        """
+        Checks that Const operations producing constant data nodes are marked as output reachable even if they are not
+        visited by the reachability walk.
+        "data_node_1" is output.
+
+        placeholder_1->placeholder_1_data_node->node_1->data_node_1
+                                                 /
+                           const_1->const_1_data
+
+        :return: None
+        """
+        graph = build_graph(nodes_attributes,
+                            [('placeholder_1', 'placeholder_1_data_node'),
+                             ('placeholder_1_data_node', 'node_1'),
+                             ('const_1', 'const_1_data'),
+                             ('const_1_data', 'node_1'),
+                             ('node_1', 'data_node_1'),
+                             ('data_node_1', 'op_output')
+                             ],
+                            {'const_1_data': {'value': const_value}},
+                            nodes_with_edges_only=True)
+        mark_dead_nodes(graph)
+
+        self.assertTrue(graph.node['const_1']['is_output_reachable'])
+        self.assertCountEqual([], graph.get_nodes_with_attributes(is_output_reachable=False))
+
+    def test_mark_output_reachable_nodes_const_op_with_inputs(self):
+        """
+        Checks that the inputs of Const operation producing constant data node are marked as output reachable.
+        "data_node_1" is output.
+
+        placeholder_1->placeholder_1_data_node->node_1->data_node_1
+                                                 /
+        placeholder_2->placeholder_2_data_node->const_1->const_1_data
+
+        :return: None
+        """
+        graph = build_graph(nodes_attributes,
+                            [('placeholder_1', 'placeholder_1_data_node'),
+                             ('placeholder_1_data_node', 'node_1'),
+                             ('placeholder_2', 'placeholder_2_data_node'),
+                             ('placeholder_2_data_node', 'const_1'),
+                             ('const_1', 'const_1_data'),
+                             ('const_1_data', 'node_1'),
+                             ('node_1', 'data_node_1'),
+                             ('data_node_1', 'op_output')
+                             ],
+                            {'const_1_data': {'value': const_value}},
+                            nodes_with_edges_only=True)
+        mark_dead_nodes(graph)
+
+        self.assertCountEqual([], graph.get_nodes_with_attributes(is_output_reachable=False))
+
+    def test_mark_output_reachable_nodes_keeps_const_ops_with_control_flow_edges(self):
+        """
+        Checks that Const operation with control flow edge is marked as output reachable and is not removed by the graph
+        clean up together with the control flow edge.
+        "data_node_1" is output.
+
+        placeholder_1->placeholder_1_data_node->node_1->data_node_1
+                                                 /
+                           const_1->const_1_data
+                          /
+        node_2-(control flow)
+
+        :return: None
+        """
+        graph = build_graph(nodes_attributes,
+                            [('placeholder_1', 'placeholder_1_data_node'),
+                             ('placeholder_1_data_node', 'node_1'),
+                             ('node_2', 'const_1', {'control_flow_edge': True}),
+                             ('const_1', 'const_1_data'),
+                             ('const_1_data', 'node_1'),
+                             ('node_1', 'data_node_1'),
+                             ('data_node_1', 'op_output')
+                             ],
+                            {'const_1_data': {'value': const_value}},
+                            nodes_with_edges_only=True)
+        mark_dead_nodes(graph)
+        self.assertTrue(graph.node['const_1']['is_output_reachable'])
+        self.assertFalse(graph.node['const_1']['is_const_producer'])
+
+        graph.clean_up()
+        self.assertTrue(graph.has_edge('node_2', 'const_1'))
+
+    def test_mark_output_reachable_nodes_after_value_change(self):
+        """
+        Checks that Const operation is output reachable and survives the dead nodes elimination after the value of the
+        data node produced by it is removed.
+        "data_node_1" is output.
+
+        placeholder_1->placeholder_1_data_node->node_1->data_node_1
+                                                 /
+                           const_1->const_1_data
+
+        Then the value of "const_1_data" is removed.
+
+        :return: None
+        """
+        graph = build_graph(nodes_attributes,
+                            [('placeholder_1', 'placeholder_1_data_node'),
+                             ('placeholder_1_data_node', 'node_1'),
+                             ('const_1', 'const_1_data'),
+                             ('const_1_data', 'node_1'),
+                             ('node_1', 'data_node_1'),
+                             ('data_node_1', 'op_output')
+                             ],
+                            {'const_1_data': {'value': const_value}},
+                            nodes_with_edges_only=True)
+        mark_dead_nodes(graph)
+        self.assertTrue(graph.node['const_1']['is_output_reachable'])
+
+        graph.node['const_1_data']['value'] = None
+        mark_undead_nodes(graph, [])
+        mark_dead_nodes(graph)
+        self.assertTrue(graph.node['const_1']['is_output_reachable'])
+
+        eliminate_dead_nodes(graph)
+        self.assertTrue('const_1' in graph.nodes())
+
+    def test_mark_output_reachable_nodes_after_graph_modification(self):
+        """
+        Checks that the result of the previous reachability marking is not reused after the graph is modified.
+        "node_4" is output.
+
+        placeholder_1->node_1->node_2
+              \
+               -> node_3->node_4
+
+        Then edge node_2->node_4 is added.
+
+        :return: None
+        """
+        graph = deepcopy(self.graph_with_unreachable_branch)
+        mark_dead_nodes(graph)
+        self.assertCountEqual(['node_1', 'node_2'],
+                              graph.get_nodes_with_attributes(is_output_reachable=False))
+
+        graph.add_edge('node_2', 'node_4')
+        mark_dead_nodes(graph)
+        self.assertListEqual([], graph.get_nodes_with_attributes(is_output_reachable=False))
+
     def test_mark_ops_producing_constant_values(self):
         """
         Checks case when operation produces only constant tensors so it could be removed. If the node produces several
@@ -140,19 +306,106 @@ class TestEliminatePass(unittest.TestCase):
                              ],
                             {'data_node_2': {},
                              'data_node_5': {},
-                             'data_node_3': {'value': np.array(1)},
-                             'data_node_6': {'value': np.array(1)}},
+                             'data_node_3': {'value': const_value},
+                             'data_node_6': {'value': const_value}},
                             nodes_with_edges_only=True)
         mark_const_producer_nodes(graph)
         self.assertTrue((graph.node['node_6']['is_const_producer']))
-        self.assertListEqual(sorted(['node_1', 'node_2', 'node_3', 'node_5', 'placeholder_1']),
-                             sorted(graph.get_nodes_with_attributes(is_const_producer=False, kind='op')))
+        self.assertCountEqual(['node_1', 'node_2', 'node_3', 'node_5', 'placeholder_1'],
+                              graph.get_nodes_with_attributes(is_const_producer=False, kind='op'))
 
         graph.clean_up()
         self.assertTrue('node_3' in graph.nodes())
         self.assertTrue('node_4' not in graph.nodes())
         self.assertTrue('node_6' not in graph.nodes())
 
+    def test_mark_dead_nodes(self):
+        """
+        Checks that both output reachable and const producer nodes are marked.
+        "data_node_2" is output.
+        "node_6" produces constant tensor "data_node_6".
+        "node_3" is not output reachable.
+
+                             node_6->data_node_6->
+                                                  \
+        placeholder_1->placeholder_1_data_node->node_1->data_node_1->node_2->data_node_2
+
+        node_3->data_node_3
+
+        :return: None
+        """
+        graph = build_graph(nodes_attributes,
+                            [('placeholder_1', 'placeholder_1_data_node'),
+                             ('placeholder_1_data_node', 'node_1'),
+                             ('node_1', 'data_node_1'),
+                             ('data_node_1', 'node_2'),
+                             ('node_2', 'data_node_2'),
+                             ('node_6', 'data_node_6'),
+                             ('data_node_6', 'node_1'),
+                             ('node_3', 'data_node_3'),
+                             ('data_node_2', 'op_output')
+                             ],
+                            {'data_node_6': {'value': const_value}},
+                            nodes_with_edges_only=True)
+        mark_dead_nodes(graph)
+
+        self.assertCountEqual(['node_3', 'data_node_3'],
+                              graph.get_nodes_with_attributes(is_output_reachable=False))
+        self.assertCountEqual(['node_6', 'op_output'],
+                              graph.get_nodes_with_attributes(is_const_producer=True, kind='op'))
+
+    def test_mark_const_producer_nodes_with_control_flow_edge(self):
+        """
+        Checks that nodes connected with control flow edge are not marked as const producers.
+        "node_6" produces constant tensor "data_node_6" and has control flow edge to "node_2".
+
+        node_6->data_node_6->node_1->data_node_1
+           \
+            -(control flow)->node_2->data_node_2
+
+        :return: None
+        """
+        graph = build_graph(nodes_attributes,
+                            [('node_6', 'data_node_6'),
+                             ('data_node_6', 'node_1'),
+                             ('node_1', 'data_node_1'),
+                             ('node_6', 'node_2', {'control_flow_edge': True}),
+                             ('node_2', 'data_node_2'),
+                             ('data_node_1', 'op_output'),
+                             ('data_node_2', 'op_output_1')
+                             ],
+                            {'data_node_6': {'value': const_value},
+                             'data_node_2': {'value': const_value}},
+                            nodes_with_edges_only=True)
+        mark_dead_nodes(graph)
+
+        self.assertCountEqual(['node_1', 'node_2', 'node_6'],
+                              graph.get_nodes_with_attributes(is_const_producer=False, kind='op'))
+
+    def test_mark_const_producer_nodes_after_control_flow_edge_change(self):
+        """
+        Checks that the const producer marking is updated after the existing edge becomes control flow edge.
+        "node_6" produces constant tensor "data_node_6".
+
+        node_6->data_node_6->node_1->data_node_1
+
+        :return: None
+        """
+        graph = build_graph(nodes_attributes,
+                            [('node_6', 'data_node_6'),
+                             ('data_node_6', 'node_1'),
+                             ('node_1', 'data_node_1'),
+                             ('data_node_1', 'op_output')
+                             ],
+                            {'data_node_6': {'value': const_value}},
+                            nodes_with_edges_only=True)
+        mark_dead_nodes(graph)
+        self.assertTrue(graph.node['node_6']['is_const_producer'])
+
+        graph['node_6']['data_node_6'][0]['control_flow_edge'] = True
+        mark_dead_nodes(graph)
+        self.assertFalse(graph.node['node_6']['is_const_producer'])
+
     def test_undead_nodes_with_constant_inputs(self):
         """
         Checks that if node of 'undead' type has constant inputs it is not removed from the graph.
@@ -177,4 +430,4 @@ class TestEliminatePass(unittest.TestCase):
                             nodes_with_edges_only=True)
         graph.erase_node(Node(graph, 'node_2'))
 
-        self.assertListEqual(sorted(['placeholder_1', 'node_1', 'node_3']), sorted(graph.nodes()))
+        self.assertCountEqual(['placeholder_1', 'node_1', 'node_3'], graph.nodes())
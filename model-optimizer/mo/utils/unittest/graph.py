@@ -14,6 +14,7 @@
  limitations under the License.
 """
 from argparse import Namespace
+from collections import Counter, defaultdict
 from copy import deepcopy
 
 import networkx as nx
@@ -154,10 +155,6 @@ def build_graph(nodes_attrs: dict, edges: list, update_attributes: dict = None,
     """
     graph = Graph()
 
-    for node_name, attrs in nodes_attrs.items():
-        if 'name' not in attrs:
-            attrs['name'] = node_name
-
     if nodes_with_edges_only:
         # filter nodes to keep only ones with edges connected
         filtered_nodes = {}
@@ -171,11 +168,20 @@ def build_graph(nodes_attrs: dict, edges: list, update_attributes: dict = None,
         nodes_attrs = filtered_nodes
 
     # create all nodes first
-    for node, attrs in nodes_attrs.items():
-        assert node not in graph.nodes()
-        graph.add_node(node, **deepcopy(attrs))
+    # the nodes_attrs dictionaries are shared between tests so they are never modified. Scalar values are shared as is,
+    # other values (like shapes) are copied because passes may modify them in place
+    node_list = [(node, {k: v if v is None or isinstance(v, (str, int, float, bool)) else deepcopy(v)
+                         for k, v in attrs.items()}) for node, attrs in nodes_attrs.items()]
+    for node, attrs in node_list:
+        attrs.setdefault('name', node)
+    graph.add_nodes_from(node_list)
+    for node, _ in node_list:
+        Node(graph, node).update_node()
 
     # connect nodes with edges
+    in_edges_count = Counter()
+    out_edges_count = Counter()
+    edge_list = []
     for item in edges:
         if len(item) == 2:  # TODO: is there any better way in python to do that?
             node_1, node_2 = item
@@ -183,11 +189,14 @@ def build_graph(nodes_attrs: dict, edges: list, update_attributes: dict = None,
         else:
             node_1, node_2, edge_attrs = item
 
-        common_attrs = {'in': len(graph.in_edges(node_2)),
-                        'out': len(graph.out_edges(node_1)),
-                        'name': nodes_attrs[node_1]['name']}
+        common_attrs = {'in': in_edges_count[node_2],
+                        'out': out_edges_count[node_1],
+                        'name': graph.node[node_1]['name']}
         common_attrs.update(edge_attrs)
-        graph.add_edge(node_1, node_2, **common_attrs)
+        edge_list.append((node_1, node_2, common_attrs))
+        in_edges_count[node_2] += 1
+        out_edges_count[node_1] += 1
+    graph.add_edges_from(edge_list)
 
     if update_attributes is not None:
         for node_name, new_attrs in update_attributes.items():
@@ -195,16 +204,22 @@ def build_graph(nodes_attrs: dict, edges: list, update_attributes: dict = None,
             for attr, value in new_attrs.items():
                 graph.node[node_name][attr] = value
 
+    # collect ports of all nodes with a single sweep over edges instead of querying edges of every node
+    in_ports = defaultdict(set)
+    out_ports = defaultdict(set)
+    for node_1, node_2, edge_attrs in graph.edges(data=True):
+        if not edge_attrs.get('control_flow_edge', False):
+            in_ports[node_2].add(edge_attrs['in'])
+            out_ports[node_1].add(edge_attrs['out'])
+
     for node in graph.get_op_nodes():
         # Add in_ports attribute
-        in_edges = node.in_edges()
-        for attr in in_edges.values():
-            node.add_input_port(idx=attr['in'])
+        for idx in sorted(in_ports[node.id], key=str):
+            node.add_input_port(idx=idx)
 
         # Add out_ports attribute
-        out_edges = node.out_edges()
-        for attr in out_edges.values():
-            node.add_output_port(idx=attr['out'])
+        for idx in sorted(out_ports[node.id], key=str):
+            node.add_output_port(idx=idx)
 
     graph.graph['cmd_params'] = Namespace(keep_shape_ops=False)
     return graph